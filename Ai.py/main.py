@@ -1,33 +1,102 @@
 import re
 import json
+import threading
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from itertools import count
 import dateparser
-from flask import Flask, request, jsonify
+import orjson
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+
+# --------------------------
+# Date Parsing
+# --------------------------
+# Building a DateDataParser is expensive, so share a single instance. Results
+# are not cached: relative inputs such as "10am" or "in 12 hours" resolve
+# against the current time.
+_date_parser = dateparser.date.DateDataParser(
+    languages=["en"], settings={"PREFER_DATES_FROM": "future"}
+)
+
+def parse_date(text):
+    # Most API callers send ISO-8601, which fromisoformat handles without
+    # going through dateparser at all.
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    return _date_parser.get_date_data(text)["date_obj"]
+
+@lru_cache(maxsize=8192)
+def format_day(day):
+    return day.strftime("%Y-%m-%d")
 
 # --------------------------
 # Calendar Agent Functions
 # --------------------------
-events = []
+# Events are keyed by an insertion counter (dicts keep insertion order), and
+# _by_desc maps a lowercased description to the ids sharing it so deletes
+# don't have to scan every event. Flask serves requests from several threads,
+# so both are only touched while holding _events_lock.
+NO_EVENTS_MESSAGE = "No events found."
+
+events = {}
+_by_desc = defaultdict(list)
+_next_id = count()
+_events_lock = threading.Lock()
 
 def add_event(date, description):
-    events.append({"date": date, "description": description})
+    with _events_lock:
+        event_id = next(_next_id)
+        events[event_id] = {"date": date, "description": description}
+        _by_desc[description.lower()].append(event_id)
     return f"Added event: '{description}' on {date}"
 
+def snapshot_events():
+    # Stored event dicts are never mutated, so a shallow copy is a safe view.
+    with _events_lock:
+        return list(events.values())
+
+def public_event(e):
+    return {"date": e["date"], "description": e["description"]}
+
 def show_events():
-    if not events:
-        return "No events found."
-    return [{"date": e["date"], "description": e["description"]} for e in events]
+    snapshot = snapshot_events()
+    if not snapshot:
+        return NO_EVENTS_MESSAGE
+    return [public_event(e) for e in snapshot]
 
 def delete_event(description):
-    global events
-    before = len(events)
-    events = [e for e in events if e["description"].lower() != description.lower()]
-    after = len(events)
-    return f"Deleted {before - after} event(s) with description '{description}'."
+    with _events_lock:
+        ids = _by_desc.pop(description.lower(), [])
+        for event_id in ids:
+            del events[event_id]
+    return f"Deleted {len(ids)} event(s) with description '{description}'."
 
 # --------------------------
 # Flask Web App
 # --------------------------
+class OrjsonProvider(JSONProvider):
+    # Only the sort_keys and default arguments of json.dumps are honoured.
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if kwargs.get("sort_keys") else 0
+        return orjson.dumps(obj, default=kwargs.get("default"), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of going
+        # through dumps() and re-encoding the str.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE), mimetype="application/json"
+        )
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 @app.route("/")
 def home():
@@ -42,16 +111,34 @@ def add():
     if not date_str or not description:
         return jsonify({"error": "Both 'date' and 'description' are required"}), 400
 
-    date = dateparser.parse(date_str)
+    date = parse_date(date_str)
     if not date:
         return jsonify({"error": "Invalid date format"}), 400
 
-    result = add_event(date.strftime("%Y-%m-%d"), description)
+    result = add_event(format_day(date.date()), description)
     return jsonify({"message": result})
 
+SHOW_CHUNK_SIZE = 512
+
 @app.route("/show", methods=["GET"])
 def show():
-    return jsonify(show_events())
+    snapshot = snapshot_events()
+    if not snapshot:
+        return jsonify(NO_EVENTS_MESSAGE)
+    if len(snapshot) <= SHOW_CHUNK_SIZE:
+        return jsonify([public_event(e) for e in snapshot])
+
+    # Large lists are streamed in chunks so the full body is never built at once.
+    def generate():
+        yield b"["
+        for i in range(0, len(snapshot), SHOW_CHUNK_SIZE):
+            if i:
+                yield b","
+            chunk = snapshot[i:i + SHOW_CHUNK_SIZE]
+            yield b",".join(orjson.dumps(public_event(e)) for e in chunk)
+        yield b"]\n"
+
+    return Response(generate(), mimetype="application/json")
 
 @app.route("/delete", methods=["DELETE"])
 def delete():